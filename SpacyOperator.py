@@ -9,7 +9,11 @@ quality of life improvements:
 * friendly error messages when configuration files or pattern files are
   missing or malformed;
 * the ability to load JSON and JSON Lines pattern files;
-* a small, well documented API that is easy to unit test.
+* a small, well documented API that is easy to unit test;
+* plain string (phrase) patterns are matched by the ``gazetteer_ruler``
+  component with a double-array Aho-Corasick automaton when :mod:`daachorse`
+  (``python-daachorse``) is installed, which keeps the matching cost
+  independent from the size of large gazetteers.
 
 The implementation purposefully relies on the lightweight ``spacy.blank``
 constructor to avoid the need of heavyweight pre-trained models.  That makes
@@ -20,22 +24,57 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 from collections.abc import MutableMapping
 import configparser
 import json
+import logging
+import os
+import re
 
 try:
+    import numpy
     import spacy
+    from spacy.attrs import ENT_IOB, ENT_TYPE, IDX, LENGTH
     from spacy.language import Language
     from spacy.pipeline import EntityRuler
+    from spacy.pipeline.entityruler import DEFAULT_ENT_ID_SEP
 except ImportError as exc:  # pragma: no cover - dependency guarded at runtime
     raise ImportError(
         "SpacyOperator requires the `spacy` package. Install it with `pip install spacy`."
     ) from exc
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+try:
+    import daachorse
+except ImportError:  # pragma: no cover - optional dependency
+    daachorse = None
+
 PatternInput = Union[str, Path, Sequence[MutableMapping[str, object]]]
 
+logger = logging.getLogger(__name__)
+
+# ``[nlp]`` sections (their body stops at the next section header) and the
+# ``lang`` options within, flagging values continued on indented lines.
+_NLP_SECTION = re.compile(r"^\[nlp\][ \t]*$(?P<body>(?:(?!^\[).)*)", re.MULTILINE | re.DOTALL)
+_NLP_LANG = re.compile(
+    r"^(?i:lang)[ \t]*[=:][ \t]*(?P<lang>.*?)[ \t]*$(?P<continuation>\n[ \t]+\S)?",
+    re.MULTILINE,
+)
+
+# Leave one core to the parent process.
+DEFAULT_N_PROCESS = max(1, (os.cpu_count() or 1) - 1)
+DEFAULT_BATCH_SIZE = 256
+
+# Phrase matcher attributes that only depend on the tokenizer output.
+_TOKENIZER_ATTRS = frozenset({"ORTH", "TEXT", "LOWER"})
+# Phrase matcher attributes equivalent to the automaton's exact text matching.
+_AUTOMATON_ATTRS = frozenset({"ORTH", "TEXT"})
+
 
 def _normalise_language(language: str) -> str:
     """Return ``language`` without surrounding quotes and in lowercase.
@@ -53,17 +92,33 @@ def _normalise_language(language: str) -> str:
     return cleaned.lower()
 
 
-def _load_config(path: Union[str, Path]) -> configparser.ConfigParser:
+def _load_config(path: Union[str, Path]) -> Mapping[str, Mapping[str, str]]:
     """Load a spaCy configuration file.
 
-    The project only requires a couple of settings, therefore the use of
-    :mod:`configparser` keeps the implementation dependency free.
+    The project only requires the ``lang`` option of the ``[nlp]`` section,
+    which is picked up with a regular expression.  Anything the expression
+    cannot vouch for is handed to :mod:`configparser`, which keeps the
+    implementation dependency free: files that are not valid UTF-8 (read with
+    the locale encoding instead), empty, continued or interpolated values, and
+    repeated ``[nlp]`` sections or ``lang`` options, which configparser
+    rejects.
     """
 
     config_path = Path(path)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path!s}")
 
+    try:
+        text = config_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        text = ""
+    sections = _NLP_SECTION.findall(text)
+    options = list(_NLP_LANG.finditer(sections[0])) if len(sections) == 1 else []
+    if len(options) == 1:
+        language = options[0].group("lang")
+        if language and "%" not in language and not options[0].group("continuation"):
+            return {"nlp": {"lang": language}}
+
     parser = configparser.ConfigParser()
     parser.read(config_path)
     if "nlp" not in parser:
@@ -75,39 +130,40 @@ def _read_patterns_from_file(path: Union[str, Path]) -> List[MutableMapping[str,
     """Parse patterns from ``path``.
 
     Supports both JSON and JSON Lines formats.  Empty lines are ignored which
-    allows developers to keep files human friendly.  The function raises a
-    :class:`ValueError` when the file contains malformed JSON so that the caller
-    can display a precise error message to the user.
+    allows developers to keep files human friendly.  JSON Lines files are
+    streamed line by line so large gazetteers are never held in memory as a
+    single string, and :mod:`orjson` is used for parsing when installed.  The
+    function raises a :class:`ValueError` when the file contains malformed JSON
+    so that the caller can display a precise error message to the user.
     """
 
     patterns_path = Path(path)
     if not patterns_path.exists():
         raise FileNotFoundError(f"Pattern file not found: {patterns_path!s}")
 
-    text = patterns_path.read_text(encoding="utf-8").strip()
-    if not text:
-        return []
-
     try:
         if patterns_path.suffix.lower() == ".jsonl":
             patterns: List[MutableMapping[str, object]] = []
-            for line_number, raw_line in enumerate(text.splitlines(), start=1):
-                stripped = raw_line.strip()
-                if not stripped:
-                    continue
-                try:
-                    record = json.loads(stripped)
-                except json.JSONDecodeError as exc:  # pragma: no cover - error path
-                    raise ValueError(
-                        f"Invalid JSON on line {line_number} of {patterns_path!s}: {exc.msg}"
-                    ) from exc
-                if not isinstance(record, MutableMapping):
-                    raise ValueError(
-                        "Each pattern in a JSONL file must be a JSON object (mapping)."
-                    )
-                patterns.append(record)
+            with patterns_path.open("rb") as handle:
+                for line_number, raw_line in enumerate(handle, start=1):
+                    if not raw_line.strip():
+                        continue
+                    try:
+                        record = _json_loads(raw_line)
+                    except json.JSONDecodeError as exc:  # pragma: no cover - error path
+                        raise ValueError(
+                            f"Invalid JSON on line {line_number} of {patterns_path!s}: {exc.msg}"
+                        ) from exc
+                    if not isinstance(record, MutableMapping):
+                        raise ValueError(
+                            "Each pattern in a JSONL file must be a JSON object (mapping)."
+                        )
+                    patterns.append(record)
             return patterns
-        data = json.loads(text)
+        raw = patterns_path.read_bytes()
+        if not raw.strip():
+            return []
+        data = _json_loads(raw)
     except json.JSONDecodeError as exc:  # pragma: no cover - error path
         raise ValueError(f"Pattern file {patterns_path!s} contains invalid JSON: {exc.msg}") from exc
 
@@ -121,6 +177,233 @@ def _read_patterns_from_file(path: Union[str, Path]) -> List[MutableMapping[str,
     raise ValueError("Pattern file must contain either an object or a list of objects.")
 
 
+def _is_phrase_pattern(entry: MutableMapping[str, object]) -> bool:
+    """Return whether ``entry`` can be served by the phrase automaton.
+
+    Only plain ``{"label": ..., "pattern": "..."}`` entries qualify.  Token
+    patterns and entries carrying an ``id`` keep going through the
+    :class:`EntityRuler` so that no spaCy feature is lost.
+    """
+
+    pattern = entry.get("pattern")
+    return (
+        isinstance(pattern, str)
+        and bool(pattern)
+        and isinstance(entry.get("label"), str)
+        and "id" not in entry
+    )
+
+
+def _dedupe_patterns(patterns: Sequence[MutableMapping[str, object]]) -> List[MutableMapping[str, object]]:
+    """Drop repeated string patterns, keeping the first occurrence.
+
+    Entries are considered equal when label, pattern and id match exactly.
+    Case variants are kept because matching is case sensitive, and token
+    patterns are passed through untouched.
+    """
+
+    seen = set()
+    unique: List[MutableMapping[str, object]] = []
+    for entry in patterns:
+        pattern = entry.get("pattern")
+        if isinstance(pattern, str):
+            key = (entry.get("label"), pattern, entry.get("id"))
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(entry)
+    if len(unique) < len(patterns):
+        logger.debug("Dropped %d of %d duplicate patterns.", len(patterns) - len(unique), len(patterns))
+    return unique
+
+
+def _entity_tuples(doc: spacy.tokens.Doc) -> List[Tuple[str, str]]:
+    """Return ``(entity, label)`` tuples for the entities of ``doc``.
+
+    Entity boundaries, labels and character offsets are read from a single
+    ``Doc.to_array`` call and the text is sliced from ``doc.text``, so no
+    :class:`~spacy.tokens.Span` is built.  ``doc.ents`` is itself stored as
+    token level IOB tags, so both views always agree.
+    """
+
+    array = doc.to_array([ENT_IOB, ENT_TYPE, IDX, LENGTH])
+    iob = array[:, 0]
+    starts = numpy.flatnonzero(iob == 3)  # "B" tags open an entity
+    if not len(starts):
+        return []
+    # An entity runs until the first token that is not tagged "I".
+    boundaries = numpy.append(numpy.flatnonzero(iob != 1), len(doc))
+    lasts = boundaries[numpy.searchsorted(boundaries, starts, side="right")] - 1
+    begin_chars = array[starts, 2].tolist()
+    end_chars = (array[lasts, 2] + array[lasts, 3]).tolist()
+    text = doc.text
+    strings = doc.vocab.strings
+    return [
+        (text[begin:end], strings[label])
+        for begin, end, label in zip(begin_chars, end_chars, array[starts, 1].tolist())
+    ]
+
+
+class GazetteerRuler(EntityRuler):
+    """:class:`EntityRuler` matching plain string patterns with an automaton.
+
+    Phrase patterns (see :func:`_is_phrase_pattern`) are compiled into a
+    double-array Aho-Corasick automaton instead of spaCy's phrase matcher.
+    The automaton compares exact text, so it is only used while
+    ``phrase_matcher_attr`` is unset or ``ORTH``.  Token patterns, entries
+    carrying an ``id`` and, when :mod:`daachorse` is not installed or another
+    attribute such as ``LOWER`` is configured, every pattern use the regular
+    ruler machinery.  Automaton
+    hits are added to the ruler's own matches before conflicts are resolved, so
+    overlaps are settled longest first exactly like in the stock ruler, and the
+    phrases are serialised together with the rest of the pipeline.
+    """
+
+    def __init__(self, nlp: Language, name: str = "gazetteer_ruler", **kwargs: Any) -> None:
+        self._phrases: Dict[str, str] = {}
+        self._automaton: Optional["daachorse.Automaton"] = None
+        self._label_ids: Optional[numpy.ndarray] = None
+        self._label_hashes: Optional[numpy.ndarray] = None
+        super().__init__(nlp, name, **kwargs)
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._phrases)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the compiled automaton; it is recompiled on the first match."""
+
+        state = self.__dict__.copy()
+        state["_automaton"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        if state.get("_phrases") and daachorse is None:
+            raise ImportError(
+                "This pipeline holds phrase patterns compiled with `python-daachorse`. "
+                "Install it with `pip install python-daachorse`."
+            )
+        self.__dict__.update(state)
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        return tuple(sorted(set(super().labels) | set(self._phrases.values())))
+
+    @property
+    def patterns(self) -> List[Dict[str, Any]]:
+        phrases = [{"label": label, "pattern": phrase} for phrase, label in self._phrases.items()]
+        return super().patterns + phrases
+
+    def clear(self) -> None:
+        super().clear()
+        self._phrases = {}
+        self._automaton = None
+        self._label_ids = None
+        self._label_hashes = None
+
+    def _routes_to_automaton(self, entry: MutableMapping[str, object]) -> bool:
+        """Return whether ``entry`` is matched by the automaton."""
+
+        attr = self.phrase_matcher_attr
+        return (
+            daachorse is not None
+            and (attr is None or str(attr).upper() in _AUTOMATON_ATTRS)
+            and _is_phrase_pattern(entry)
+        )
+
+    def add_patterns(self, patterns: List[Dict[str, Any]]) -> None:
+        """Register ``patterns``, routing phrase patterns to the automaton.
+
+        A phrase registered twice keeps its last label.  The automaton is
+        immutable and has to be compiled from every registered phrase, so
+        compilation is deferred to the next match: adding patterns over many
+        calls costs a single build.
+        """
+
+        ruler_patterns = []
+        phrases_added = False
+        for entry in patterns:
+            if self._routes_to_automaton(entry):
+                self._phrases[entry["pattern"]] = entry["label"]
+                phrases_added = True
+            else:
+                ruler_patterns.append(entry)
+        if ruler_patterns:
+            super().add_patterns(ruler_patterns)
+        if phrases_added:
+            self._automaton = None
+
+    def _build_automaton(self) -> None:
+        """Compile the registered phrases and their label side table.
+
+        Labels are interned and each pattern id maps to its label through a
+        compact ``uint16`` array (``uint32`` should a gazetteer ever define
+        more than 65536 labels).
+        """
+
+        label_index: Dict[str, int] = {}
+        ids = [label_index.setdefault(label, len(label_index)) for label in self._phrases.values()]
+        dtype = numpy.uint16 if len(label_index) <= numpy.iinfo(numpy.uint16).max + 1 else numpy.uint32
+        strings = self.nlp.vocab.strings
+        self._label_ids = numpy.array(ids, dtype=dtype)
+        self._label_hashes = numpy.array([strings.add(label) for label in label_index], dtype=numpy.uint64)
+        self._automaton = daachorse.Automaton(list(self._phrases))
+
+    def _match_phrases(self, doc: spacy.tokens.Doc) -> List[Tuple[int, int, int]]:
+        """Return ``(label, start, end)`` token matches of the automaton.
+
+        Hits that do not line up with token boundaries are discarded, which
+        keeps the behaviour consistent with spaCy's phrase matcher.
+        """
+
+        if not self._phrases or not len(doc):
+            return []
+        if self._automaton is None:
+            self._build_automaton()
+        hits = self._automaton.find_overlapping(doc.text)
+        if not hits:
+            return []
+        hits = numpy.array(hits, dtype=numpy.int64)
+        offsets = doc.to_array([IDX, LENGTH]).astype(numpy.int64)
+        token_starts = offsets[:, 0]
+        token_ends = token_starts + offsets[:, 1]
+        first = numpy.minimum(numpy.searchsorted(token_starts, hits[:, 0]), len(doc) - 1)
+        last = numpy.minimum(numpy.searchsorted(token_ends, hits[:, 1]), len(doc) - 1)
+        aligned = (token_starts[first] == hits[:, 0]) & (token_ends[last] == hits[:, 1])
+        labels = self._label_hashes[self._label_ids[hits[aligned, 2]]]
+        return list(zip(labels.tolist(), first[aligned].tolist(), (last[aligned] + 1).tolist()))
+
+    def match(self, doc: spacy.tokens.Doc) -> List[Tuple[int, int, int]]:
+        matches = super().match(doc)
+        phrase_matches = self._match_phrases(doc)
+        if not phrase_matches:
+            return matches
+        # Same ordering as EntityRuler.match: longest first, then leftmost.
+        combined = set(matches).union(phrase_matches)
+        return sorted(combined, key=lambda m: (m[2] - m[1], -m[1]), reverse=True)
+
+
+# The factory arguments are left unannotated: spaCy validates them against the
+# annotations, which ``from __future__ import annotations`` turns into strings.
+@Language.factory(
+    "gazetteer_ruler",
+    default_config={
+        "phrase_matcher_attr": None,
+        "validate": False,
+        "overwrite_ents": False,
+        "ent_id_sep": DEFAULT_ENT_ID_SEP,
+    },
+)
+def _make_gazetteer_ruler(nlp, name, phrase_matcher_attr, validate, overwrite_ents, ent_id_sep):
+    return GazetteerRuler(
+        nlp,
+        name,
+        phrase_matcher_attr=phrase_matcher_attr,
+        validate=validate,
+        overwrite_ents=overwrite_ents,
+        ent_id_sep=ent_id_sep,
+    )
+
+
 @dataclass
 class SpacyOperator:
     """Convenience wrapper around a spaCy :class:`~spacy.language.Language` object.
@@ -134,7 +417,7 @@ class SpacyOperator:
     """
 
     nlp: Language
-    _ruler: Optional[EntityRuler] = field(default=None, init=False, repr=False)
+    _ruler: Optional[GazetteerRuler] = field(default=None, init=False, repr=False)
 
     # ------------------------------------------------------------------
     # Construction helpers
@@ -156,7 +439,7 @@ class SpacyOperator:
             required and the ``lang`` option dictates which blank pipeline will
             be used.
         patterns:
-            Optional patterns to be registered in an :class:`EntityRuler`.  They
+            Optional patterns to be registered in a :class:`GazetteerRuler`.  They
             can be provided either as a sequence of dictionaries or as a path to
             a JSON/JSONL file on disk.
         overwrite_ents:
@@ -165,7 +448,7 @@ class SpacyOperator:
         """
 
         parser = _load_config(config_path)
-        language = _normalise_language(parser.get("nlp", "lang", fallback="en"))
+        language = _normalise_language(parser["nlp"].get("lang", "en"))
         nlp = spacy.blank(language)
         operator = cls(nlp)
         if patterns:
@@ -175,21 +458,51 @@ class SpacyOperator:
     # ------------------------------------------------------------------
     # Pattern management
     # ------------------------------------------------------------------
-    def _ensure_ruler(self, overwrite_ents: bool) -> EntityRuler:
-        """Return the :class:`EntityRuler`, creating it if necessary."""
+    def _ensure_ruler(self, overwrite_ents: bool) -> GazetteerRuler:
+        """Return the :class:`GazetteerRuler`, creating it if necessary."""
 
         if self._ruler is None:
-            self._ruler = self.nlp.add_pipe("entity_ruler", config={"overwrite_ents": overwrite_ents})
+            self._ruler = self.nlp.add_pipe("gazetteer_ruler", config={"overwrite_ents": overwrite_ents})
         else:
             # spaCy exposes the flag via the ``overwrite" attribute on the ruler.
             self._ruler.overwrite = overwrite_ents
         return self._ruler
 
-    def add_patterns(self, patterns: PatternInput, *, overwrite_ents: bool = False) -> None:
+    def _add_ruler_patterns(
+        self, patterns: Sequence[MutableMapping[str, object]], overwrite_ents: bool
+    ) -> None:
+        """Register ``patterns`` in the entity ruler.
+
+        Every pipeline component is disabled while the ruler tokenizes the
+        string patterns it keeps for its phrase matcher, provided
+        ``phrase_matcher_attr`` only depends on the tokenizer.
+        """
+
+        ruler = self._ensure_ruler(overwrite_ents)
+        attr = ruler.phrase_matcher_attr
+        tokenizer_only = attr is None or str(attr).upper() in _TOKENIZER_ATTRS
+        reaches_matcher = any(
+            isinstance(entry.get("pattern"), str) and not ruler._routes_to_automaton(entry)
+            for entry in patterns
+        )
+        if tokenizer_only and reaches_matcher:
+            with self.nlp.select_pipes(disable=list(self.nlp.pipe_names)):
+                ruler.add_patterns(patterns)
+        else:
+            ruler.add_patterns(patterns)
+
+    def add_patterns(
+        self, patterns: PatternInput, *, overwrite_ents: bool = False, dedupe: bool = True
+    ) -> None:
         """Load patterns into the pipeline's entity ruler.
 
+        Phrase patterns (a ``label`` and a plain string ``pattern``) are
+        compiled into the ruler's Aho-Corasick automaton when
+        ``python-daachorse`` is available; token patterns always go through the
+        regular :class:`EntityRuler` matchers.
         ``patterns`` accepts either a path to a JSON/JSONL file or a sequence of
-        dictionaries already in memory.  Invalid entries raise a
+        dictionaries already in memory.  With ``dedupe`` repeated string
+        patterns are dropped before registration.  Invalid entries raise a
         :class:`ValueError` explaining the problem so callers can surface a
         useful error message.
         """
@@ -203,8 +516,10 @@ class SpacyOperator:
                 raise ValueError("All patterns must be mappings with spaCy keys such as 'label' and 'pattern'.")
         if not loaded_patterns:
             return
-        ruler = self._ensure_ruler(overwrite_ents)
-        ruler.add_patterns(list(loaded_patterns))
+        if dedupe:
+            loaded_patterns = _dedupe_patterns(loaded_patterns)
+
+        self._add_ruler_patterns(loaded_patterns, overwrite_ents)
 
     # ------------------------------------------------------------------
     # Text processing helpers
@@ -216,19 +531,42 @@ class SpacyOperator:
             raise TypeError("text must be a string")
         return self.nlp(text)
 
-    def pipe(self, texts: Iterable[str]) -> Iterator[spacy.tokens.Doc]:
-        """Process multiple texts using spaCy's efficient :meth:`Language.pipe`."""
+    def pipe(
+        self,
+        texts: Iterable[str],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        n_process: int = DEFAULT_N_PROCESS,
+    ) -> Iterator[spacy.tokens.Doc]:
+        """Process multiple texts using spaCy's efficient :meth:`Language.pipe`.
+
+        ``batch_size`` and ``n_process`` are forwarded to spaCy, which forks
+        ``n_process`` workers each running its own copy of the pipeline,
+        including the phrase automaton.  A pipeline without components only
+        tokenizes, which is not worth a worker pool, so it runs in-process.
+        """
 
-        return self.nlp.pipe(texts)
+        if not self.nlp.pipe_names:
+            n_process = 1
+        return self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
 
     def extract_entities(self, text: str) -> List[Tuple[str, str]]:
         """Return ``(entity, label)`` tuples found in ``text``."""
 
-        doc = self(text)
-        return [(ent.text, ent.label_) for ent in doc.ents]
+        return _entity_tuples(self(text))
+
+    def extract_entities_batch(self, texts: Iterable[str], **kwargs: int) -> Iterator[List[Tuple[str, str]]]:
+        """Yield ``(entity, label)`` tuples for each of ``texts``.
+
+        Keyword arguments (``batch_size``, ``n_process``) are forwarded to
+        :meth:`pipe`.
+        """
+
+        for doc in self.pipe(texts, **kwargs):
+            yield _entity_tuples(doc)
 
 
-__all__ = ["SpacyOperator"]
+__all__ = ["GazetteerRuler", "SpacyOperator"]
 {
   "name": "CNE Codex Dev",
   "image": "mcr.microsoft.com/devcontainers/python:3.11",
@@ -0,0 +1 @@
+"""Pytest configuration: keeps the repository root importable from ``tests/``."""
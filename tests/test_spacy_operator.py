@@ -0,0 +1,185 @@
+"""Tests for :mod:`SpacyOperator` and its ``gazetteer_ruler`` component."""
+from __future__ import annotations
+
+import configparser
+import pickle
+from pathlib import Path
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+import SpacyOperator as spacy_operator  # noqa: E402
+from SpacyOperator import SpacyOperator  # noqa: E402
+
+requires_daachorse = pytest.mark.skipif(
+    spacy_operator.daachorse is None, reason="python-daachorse is not installed"
+)
+
+
+def _operator(patterns, *, language: str = "en", overwrite_ents: bool = False) -> SpacyOperator:
+    operator = SpacyOperator(spacy.blank(language))
+    operator.add_patterns(patterns, overwrite_ents=overwrite_ents)
+    return operator
+
+
+@requires_daachorse
+def test_phrase_patterns_are_compiled_into_the_automaton():
+    operator = _operator([{"label": "ORG", "pattern": "OpenAI"}])
+
+    assert operator.extract_entities("I like OpenAI a lot") == [("OpenAI", "ORG")]
+    assert operator._ruler._phrases == {"OpenAI": "ORG"}
+    assert not operator._ruler.phrase_patterns
+
+
+@requires_daachorse
+def test_hits_off_token_boundaries_are_dropped():
+    operator = _operator([{"label": "ORG", "pattern": "Open"}])
+
+    assert operator.extract_entities("OpenAI is reopening") == []
+
+
+@requires_daachorse
+def test_longer_token_pattern_wins_over_phrase():
+    operator = _operator(
+        [
+            {"label": "LOC", "pattern": "New York"},
+            {"label": "GPE", "pattern": [{"LOWER": "new"}, {"LOWER": "york"}, {"LOWER": "city"}]},
+        ]
+    )
+
+    assert operator.extract_entities("I love New York City") == [("New York City", "GPE")]
+
+
+@requires_daachorse
+def test_longer_phrase_wins_over_token_pattern():
+    operator = _operator(
+        [
+            {"label": "LOC", "pattern": "New York City"},
+            {"label": "GPE", "pattern": [{"LOWER": "new"}, {"LOWER": "york"}]},
+        ]
+    )
+
+    assert operator.extract_entities("I love New York City") == [("New York City", "LOC")]
+
+
+@requires_daachorse
+@pytest.mark.parametrize(
+    ("overwrite_ents", "expected"),
+    [(False, [("York", "ORG")]), (True, [("New York", "LOC")])],
+)
+def test_overwrite_ents_against_existing_entities(overwrite_ents, expected):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns([{"label": "ORG", "pattern": "York"}])
+    operator = SpacyOperator(nlp)
+    operator.add_patterns([{"label": "LOC", "pattern": "New York"}], overwrite_ents=overwrite_ents)
+
+    assert operator.extract_entities("Flights to New York today") == expected
+
+
+@requires_daachorse
+def test_offsets_are_characters_in_portuguese_text():
+    operator = _operator(
+        [{"label": "LOC", "pattern": "Évora"}, {"label": "LOC", "pattern": "São Paulo"}],
+        language="pt",
+    )
+
+    text = "A Câmara de Évora geminou-se com São Paulo em 2019."
+    assert operator.extract_entities(text) == [("Évora", "LOC"), ("São Paulo", "LOC")]
+
+
+@requires_daachorse
+def test_patterns_added_over_several_calls_are_all_matched():
+    operator = _operator([{"label": "ORG", "pattern": "OpenAI"}])
+    assert operator.extract_entities("OpenAI") == [("OpenAI", "ORG")]
+
+    operator.add_patterns([{"label": "LOC", "pattern": "Lisboa"}])
+
+    assert operator.extract_entities("OpenAI em Lisboa") == [("OpenAI", "ORG"), ("Lisboa", "LOC")]
+
+
+def test_lower_phrase_matcher_attr_matches_case_insensitively():
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("gazetteer_ruler", config={"phrase_matcher_attr": "LOWER"})
+    ruler.add_patterns([{"label": "ORG", "pattern": "OpenAI"}])
+
+    doc = nlp("we use openai daily")
+
+    assert [(ent.text, ent.label_) for ent in doc.ents] == [("openai", "ORG")]
+    assert not ruler._phrases
+
+
+@requires_daachorse
+def test_pickle_round_trip_keeps_phrases():
+    operator = _operator([{"label": "LOC", "pattern": "São Paulo"}], language="pt")
+    operator.extract_entities("São Paulo")  # compile the automaton before pickling
+
+    nlp = pickle.loads(pickle.dumps(operator.nlp))
+
+    doc = nlp("Vivo em São Paulo.")
+    assert [(ent.text, ent.label_) for ent in doc.ents] == [("São Paulo", "LOC")]
+
+
+@requires_daachorse
+def test_to_disk_from_disk_keeps_phrases(tmp_path):
+    operator = _operator(
+        [
+            {"label": "LOC", "pattern": "Lisboa"},
+            {"label": "GPE", "pattern": [{"LOWER": "porto"}]},
+        ],
+        language="pt",
+    )
+    operator.nlp.to_disk(tmp_path)
+
+    nlp = spacy.load(tmp_path)
+
+    doc = nlp("De Lisboa ao Porto")
+    assert [(ent.text, ent.label_) for ent in doc.ents] == [("Lisboa", "LOC"), ("Porto", "GPE")]
+    assert nlp.get_pipe("gazetteer_ruler")._phrases == {"Lisboa": "LOC"}
+
+
+def test_extract_entities_matches_doc_ents():
+    operator = _operator(
+        [
+            {"label": "LOC", "pattern": [{"LOWER": "rio"}, {"LOWER": "de"}, {"LOWER": "janeiro"}]},
+            {"label": "ORG", "pattern": [{"LOWER": "cne"}]},
+        ],
+        language="pt",
+    )
+
+    doc = operator("A CNE  reuniu no Rio de Janeiro, CNE")
+
+    assert operator.extract_entities(doc.text) == [(ent.text, ent.label_) for ent in doc.ents]
+    assert operator.extract_entities(doc.text) == [
+        ("CNE", "ORG"),
+        ("Rio de Janeiro", "LOC"),
+        ("CNE", "ORG"),
+    ]
+
+
+def test_from_config_reads_bundled_language():
+    config_path = Path(__file__).resolve().parents[1] / "configs" / "config_a.cfg"
+
+    assert SpacyOperator.from_config(config_path).nlp.lang == "pt"
+
+
+def test_from_config_follows_configparser_on_continued_values(tmp_path):
+    config_path = tmp_path / "config.cfg"
+    config_path.write_text("[nlp]\nlang =\n  pt\n", encoding="utf-8")
+
+    assert SpacyOperator.from_config(config_path).nlp.lang == "pt"
+
+
+@pytest.mark.parametrize(
+    ("content", "error"),
+    [
+        ("[nlp]\nlang=pt\nlang=en\n", configparser.DuplicateOptionError),
+        ("[nlp]\nlang=pt\n[nlp]\nlang=en\n", configparser.DuplicateSectionError),
+    ],
+)
+def test_from_config_rejects_duplicates_like_configparser(tmp_path, content, error):
+    config_path = tmp_path / "config.cfg"
+    config_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(error):
+        SpacyOperator.from_config(config_path)
@@ -1,8 +1,9 @@
 """HTTP routes powering the front-end document processor."""
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
-from typing import Dict
+from typing import Deque, Dict, Iterator, List
 import io
 import tempfile
 import zipfile
@@ -14,7 +15,6 @@ from flask import (
     redirect,
     render_template,
     request,
-    send_file,
     url_for,
 )
 from werkzeug.datastructures import FileStorage
@@ -49,34 +49,75 @@ def init_app(app: Flask) -> None:
         return render_template("index.html")
 
 
+class _ChunkBuffer(io.RawIOBase):
+    """Write-only, unseekable sink collecting the bytes emitted by :mod:`zipfile`.
+
+    Being unseekable makes :class:`zipfile.ZipFile` write data descriptors
+    after each member, so the archive can be sent while it is being built.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: Deque[bytes] = deque()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> Iterator[bytes]:
+        while self._chunks:
+            yield self._chunks.popleft()
+
+
+def _iter_zip(
+    temp_dir: tempfile.TemporaryDirectory, exports: Dict[str, List[Path]]
+) -> Iterator[bytes]:
+    """Yield a ZIP archive with the exported CSVs while it is being built.
+
+    The generator owns ``temp_dir`` and removes it once the archive has been
+    sent.  Only the ZIP assembly happens here, after the response headers are
+    out; everything that can fail runs beforehand in :func:`_handle_upload`.
+    """
+
+    buffer = _ChunkBuffer()
+    with temp_dir, zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as bundle:
+        for operator, csv_paths in exports.items():
+            for csv_path in csv_paths:
+                bundle.write(csv_path, arcname=f"Operador_{operator}/{csv_path.name}")
+                yield from buffer.drain()
+    yield from buffer.drain()
+
+
 def _handle_upload(file: FileStorage) -> Response:
-    """Process ``file`` and return a ZIP file with the operator CSVs."""
+    """Process ``file`` and stream back a ZIP file with the operator CSVs."""
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir) / secure_filename(file.filename)
+    temp_dir = tempfile.TemporaryDirectory()
+    try:
+        temp_root = Path(temp_dir.name)
+        temp_path = temp_root / secure_filename(file.filename)
         file.save(temp_path)
 
         tables = extract_tables(temp_path)
         if not tables:
             raise ValueError("O documento não contém tabelas com dados.")
 
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
-            for operator, options in OPERATORS.items():
-                export_dir = Path(temp_dir) / f"operator_{operator.lower()}"
-                csv_paths = export_tables_to_csv(
-                    tables,
-                    export_dir,
-                    basename=options["basename"],
-                )
-                for csv_path in csv_paths:
-                    arcname = f"Operador_{operator}/{csv_path.name}"
-                    bundle.write(csv_path, arcname=arcname)
-
-        zip_buffer.seek(0)
-    return send_file(
-        zip_buffer,
+        exports = {
+            operator: export_tables_to_csv(
+                tables,
+                temp_root / f"operator_{operator.lower()}",
+                basename=options["basename"],
+            )
+            for operator, options in OPERATORS.items()
+        }
+    except BaseException:
+        temp_dir.cleanup()
+        raise
+
+    return Response(
+        _iter_zip(temp_dir, exports),
         mimetype="application/zip",
-        as_attachment=True,
-        download_name="operadores_csv.zip",
+        headers={"Content-Disposition": "attachment; filename=operadores_csv.zip"},
     )